@@ -12,12 +12,16 @@ Design goals:
 - JSON output by default (machine- and human-friendly)
 """
 
-import json
+from __future__ import annotations
+
 import os
+import sys
+from typing import TYPE_CHECKING
 
 import typer
 
-from intake_client.client import IntakeClient
+if TYPE_CHECKING:
+    from intake_client.client import IntakeClient
 
 # Typer application instance.
 # This defines the root CLI command group (e.g. `intake <command>`).
@@ -41,7 +45,12 @@ def get_client() -> IntakeClient:
 
     Raises:
         typer.BadParameter: if required configuration is missing
+
+    The SDK (and therefore `requests`) is imported here rather than at module
+    level, so `intake --help` and argument errors never pay for it.
     """
+    from intake_client.client import IntakeClient
+
     base_url = os.getenv("INTAKE_API_URL", "http://localhost:8000/api/v1")
     token = os.getenv("INTAKE_API_TOKEN")
 
@@ -53,6 +62,31 @@ def get_client() -> IntakeClient:
     return IntakeClient(base_url=base_url, token=token)
 
 
+def _echo_json(result: dict) -> None:
+    """
+    Print an API response as indented JSON.
+
+    Serializers are imported on first use so that `--help` and usage errors,
+    which never print a result, skip them entirely.
+
+    When the optional `orjson` package is installed (`pip install
+    "client[speedups]"`), it serializes straight to UTF-8 bytes that are
+    written to stdout as-is. Otherwise the stdlib `json` module is used.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        typer.echo(json.dumps(result, indent=2))
+        return
+
+    sys.stdout.buffer.write(
+        orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    sys.stdout.buffer.flush()
+
+
 @app.command()
 def create_profile(
     first_name: str,
@@ -73,8 +107,6 @@ def create_profile(
             --email cgrente@gmail.com \
             --github-url https://github.com/cgrente
     """
-    client = get_client()
-
     # Build the payload explicitly to keep CLI parameters decoupled
     # from the underlying API schema.
     payload = {
@@ -84,11 +116,12 @@ def create_profile(
         "github_url": github_url,
     }
 
-    result = client.create_profile(payload)
+    with get_client() as client:
+        result = client.create_profile(payload)
 
     # Output formatted JSON so results are easy to read
     # and can be piped into other tools if needed.
-    typer.echo(json.dumps(result, indent=2))
+    _echo_json(result)
 
 
 @app.command()
@@ -105,9 +138,9 @@ def upload(
     Example:
         intake upload <profile_id> ./resume.pdf
     """
-    client = get_client()
-    result = client.upload_pdf(profile_id, file)
-    typer.echo(json.dumps(result, indent=2))
+    with get_client() as client:
+        result = client.upload_pdf(profile_id, file)
+    _echo_json(result)
 
 
 @app.command()
@@ -123,9 +156,9 @@ def submit(
     Example:
         intake submit <submission_id>
     """
-    client = get_client()
-    result = client.submit(submission_id)
-    typer.echo(json.dumps(result, indent=2))
+    with get_client() as client:
+        result = client.submit(submission_id)
+    _echo_json(result)
 
 
 @app.command()
@@ -144,9 +177,9 @@ def status(
     Example:
         intake status <submission_id>
     """
-    client = get_client()
-    result = client.status(submission_id)
-    typer.echo(json.dumps(result, indent=2))
+    with get_client() as client:
+        result = client.status(submission_id)
+    _echo_json(result)
 
 
 def main():
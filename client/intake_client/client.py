@@ -11,7 +11,15 @@ Design principles:
 - Return raw API responses to allow flexible consumption
 """
 
+from __future__ import annotations
+
+import os
+from types import TracebackType
+
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
 
 class IntakeClient:
@@ -19,14 +27,21 @@ class IntakeClient:
     Client for the Profile Intake API.
 
     This class provides a small, explicit interface over the API endpoints
-    without embedding CLI concerns, retries, or output formatting.
+    without embedding CLI concerns or output formatting.
     Those concerns are intentionally handled by higher-level layers
     (e.g. CLI, scripts, or applications).
 
+    Transient gateway errors are retried at the transport level
+    (see `__init__`), so callers never see a bare 502/503/504 on reads.
+
     The client is designed to be:
     - easy to mock in tests
     - reusable across scripts and tools
     - explicit in its behavior
+
+    It can be used as a context manager, so a multi-step workflow
+    (upload -> submit -> status) runs over one pooled keep-alive
+    connection and the connection is released when the block exits.
     """
 
     def __init__(self, base_url: str, token: str):
@@ -42,16 +57,60 @@ class IntakeClient:
             - reuse TCP connections
             - apply default headers once
             - improve performance for multiple calls
+
+            The mounted adapter keeps up to `pool_maxsize` keep-alive
+            connections per host and retries connection failures plus
+            gateway errors with a short backoff. Status-based retries are
+            limited to GET: replaying a POST after the server may already
+            have applied it (e.g. /submit) is not safe. A gateway error that
+            persists after the retries is still raised as `HTTPError`.
         """
         self.session = requests.Session()
 
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                # Hand the last response back once retries run out, so it
+                # fails in `_parse` with `HTTPError` like any other error.
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Every endpoint returns JSON; advertise it once for the whole session.
+        self.session.headers["Accept"] = "application/json"
+
         # Attach Authorization header once at construction time
-        # to avoid repeating it for every request.
-        self.session.headers["Authorization"] = f"Bearer {token}"
+        # to avoid repeating it for every request. It is pre-encoded so the
+        # value goes on the wire as-is instead of being encoded per request.
+        self.session.headers["Authorization"] = f"Bearer {token}".encode("ascii")
+
+        # Keep-alive is the HTTP/1.1 default; stating it explicitly helps
+        # intermediaries that would otherwise close the connection.
+        self.session.headers["Connection"] = "keep-alive"
 
         # Store base URL separately to keep endpoint construction explicit.
         self.base_url = base_url.rstrip("/")
 
+    @staticmethod
+    def _parse(response: requests.Response) -> dict:
+        """
+        Return the parsed JSON body of a response.
+
+        Raises:
+            requests.HTTPError: for 4xx/5xx responses. The exception is only
+            built on the error path; successful responses skip it entirely.
+        """
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return response.json()
+
     def create_profile(self, payload: dict) -> dict:
         """
         Create a new profile resource.
@@ -67,8 +126,7 @@ class IntakeClient:
             f"{self.base_url}/profiles",
             json=payload,
         )
-        response.raise_for_status()
-        return response.json()
+        return self._parse(response)
 
     def upload_pdf(self, profile_id: str, path: str) -> dict:
         """
@@ -82,18 +140,24 @@ class IntakeClient:
             Parsed JSON response representing the created submission.
 
         Notes:
-            - File handling is kept minimal and explicit
-            - The server enforces PDF-only validation
+            - The file is streamed from disk in chunks rather than buffered
+              into an in-memory multipart body, so memory stays flat
+              regardless of PDF size and Content-Length is still exact.
+            - The part is labelled `application/pdf` explicitly; the server
+              enforces PDF-only validation.
         """
         with open(path, "rb") as f:
+            encoder = MultipartEncoder(
+                fields={"file": (os.path.basename(path), f, "application/pdf")},
+            )
             response = self.session.post(
                 f"{self.base_url}/submissions",
                 params={"profile_id": profile_id},
-                files={"file": f},
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
             )
 
-        response.raise_for_status()
-        return response.json()
+        return self._parse(response)
 
     def submit(self, submission_id: str) -> dict:
         """
@@ -106,8 +170,7 @@ class IntakeClient:
             Parsed JSON response representing the updated submission.
         """
         response = self.session.post(f"{self.base_url}/submissions/{submission_id}/submit")
-        response.raise_for_status()
-        return response.json()
+        return self._parse(response)
 
     def status(self, submission_id: str) -> dict:
         """
@@ -121,5 +184,19 @@ class IntakeClient:
             and associated metadata.
         """
         response = self.session.get(f"{self.base_url}/submissions/{submission_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._parse(response)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> IntakeClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
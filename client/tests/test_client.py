@@ -10,8 +10,13 @@ HTTP calls are mocked to keep tests fast, deterministic,
 and independent of the server implementation.
 """
 
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import MagicMock
 
+import pytest
+import requests
+
 from intake_client.client import IntakeClient
 
 
@@ -25,7 +30,7 @@ def test_client_sets_auth_header():
     """
     client = IntakeClient(base_url="http://localhost:8000/api/v1", token="abc")
 
-    assert client.session.headers["Authorization"] == "Bearer abc"
+    assert client.session.headers["Authorization"] == b"Bearer abc"
 
 
 def test_create_profile_calls_post():
@@ -42,6 +47,7 @@ def test_create_profile_calls_post():
 
     # Mock the session.post method so no real HTTP request is made.
     client.session.post = MagicMock()
+    client.session.post.return_value.status_code = 201
     client.session.post.return_value.json.return_value = {"id": "123"}
 
     payload = {
@@ -58,3 +64,113 @@ def test_create_profile_calls_post():
 
     # Ensure the client returns the parsed JSON payload unchanged.
     assert result["id"] == "123"
+
+
+def test_client_mounts_pooled_retrying_adapter():
+    """
+    The session should use a tuned connection pool with transport-level retries.
+
+    Retries on gateway errors are limited to GET so that non-idempotent
+    calls such as /submit are never replayed behind the caller's back.
+    """
+    client = IntakeClient(base_url="http://localhost:8000/api/v1", token="abc")
+
+    adapter = client.session.get_adapter("https://example.com")
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert client.session.headers["Accept"] == "application/json"
+
+
+def test_upload_pdf_streams_multipart_body(tmp_path):
+    """
+    Uploading a PDF should stream a multipart body labelled as application/pdf
+    instead of handing an open file to `files=` (which buffers it in memory).
+    """
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n%fake pdf for tests\n")
+
+    client = IntakeClient(base_url="http://localhost:8000/api/v1", token="abc")
+    client.session.post = MagicMock()
+    client.session.post.return_value.status_code = 200
+    client.session.post.return_value.json.return_value = {"id": "sub-1"}
+
+    result = client.upload_pdf("profile-1", str(pdf))
+
+    kwargs = client.session.post.call_args.kwargs
+    encoder = kwargs["data"]
+
+    assert "files" not in kwargs
+    assert kwargs["params"] == {"profile_id": "profile-1"}
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+    assert encoder.fields["file"][0] == "resume.pdf"
+    assert encoder.fields["file"][2] == "application/pdf"
+    assert result["id"] == "sub-1"
+
+
+def test_error_responses_raise_http_error():
+    """
+    4xx/5xx responses should surface as `requests.HTTPError`
+    instead of being parsed as a successful payload.
+    """
+    client = IntakeClient(base_url="http://localhost:8000/api/v1", token="abc")
+
+    response = requests.Response()
+    response.status_code = 409
+    response.url = "http://localhost:8000/api/v1/submissions/1/submit"
+    client.session.post = MagicMock(return_value=response)
+
+    with pytest.raises(requests.HTTPError):
+        client.submit("1")
+
+
+def test_persistent_gateway_error_raises_http_error():
+    """
+    A GET that keeps failing with 503 is retried, then surfaces as
+    `requests.HTTPError` (not urllib3's `RetryError`) once retries run out.
+
+    Retries happen inside urllib3, below the session, so this test talks
+    to a throwaway local HTTP server instead of a mock.
+    """
+    attempts = []
+
+    class AlwaysUnavailable(BaseHTTPRequestHandler):
+        def do_GET(self):
+            attempts.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), AlwaysUnavailable)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}/api/v1"
+        with IntakeClient(base_url=base_url, token="abc") as client:
+            adapter = client.session.get_adapter(base_url)
+            adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+
+            with pytest.raises(requests.HTTPError) as excinfo:
+                client.status("1")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert excinfo.value.response.status_code == 503
+    assert len(attempts) == 4  # first try + 3 retries
+
+
+def test_client_context_manager_closes_session():
+    """
+    Using the client as a context manager should close its HTTP session
+    (and the pooled connections) when the block exits.
+    """
+    with IntakeClient(base_url="http://localhost:8000/api/v1", token="abc") as client:
+        client.session.close = MagicMock()
+
+    client.session.close.assert_called_once()
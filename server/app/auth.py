@@ -1,39 +1,63 @@
 """
 Authentication utilities for the Profile Intake API.
 
-This module provides request-level authentication dependencies
-used by FastAPI routes to enforce Bearer token access.
+This module provides the ASGI middleware that enforces
+Bearer token access on all API routes.
 """
 
 from __future__ import annotations
 
-from fastapi import HTTPException, Security
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import hmac
 
-from .config import settings
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-_bearer_scheme = HTTPBearer(auto_error=False)
+from .config import get_settings
 
 
-def require_auth(
-    credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
-) -> None:
+class BearerAuthMiddleware:
     """
-    Enforce Bearer token authentication on protected endpoints.
-
-    - Uses FastAPI's Security() + HTTPBearer so OpenAPI/Swagger reflects auth correctly.
-    - Returns 401 with a WWW-Authenticate header, which is standard for Bearer auth.
+    Enforce Bearer token authentication on every route under `prefix`.
+
+    This is a pure ASGI middleware rather than a per-route dependency:
+    - the token is checked on the raw header bytes before FastAPI's routing
+      and dependency resolution run, so unauthorized requests are rejected
+      early and authorized ones skip a dependency call;
+    - the expected token is encoded once, when the middleware is built at
+      application startup.
+
+    Unauthorized requests get a 401 with a `WWW-Authenticate` header, which
+    is standard for Bearer auth. Tokens are compared with
+    `hmac.compare_digest`, whose running time does not depend on where the
+    first mismatching byte is.
     """
-    if credentials is None or credentials.scheme.lower() != "bearer":
-        raise HTTPException(
-            status_code=401,
-            detail="Unauthorized",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    if credentials.credentials != settings.api_token:
-        raise HTTPException(
+    def __init__(self, app: ASGIApp, prefix: str = "/api/") -> None:
+        self.app = app
+        self.prefix = prefix
+        self._token = get_settings().api_token.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        if self._is_authorized(scope):
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            {"detail": "Unauthorized"},
             status_code=401,
-            detail="Unauthorized",
             headers={"WWW-Authenticate": "Bearer"},
         )
+        await response(scope, receive, send)
+
+    def _is_authorized(self, scope: Scope) -> bool:
+        """Check the request's `Authorization` header against the API token."""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                # The scheme name is case-insensitive (RFC 7235).
+                scheme, _, token = value.partition(b" ")
+                return scheme.lower() == b"bearer" and hmac.compare_digest(token, self._token)
+        return False
@@ -10,6 +10,7 @@ Using BaseSettings allows:
 - centralized configuration management
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -44,6 +45,18 @@ class Settings(BaseSettings):
     # Defaults to a local SQLite database for simplicity.
     database_url: str = "sqlite:///./data.db"
 
+    # Connection pool sizing for the SQLAlchemy engine.
+    # `db_pool_size` connections are kept open; up to `db_max_overflow`
+    # extra ones may be opened under bursts. For PostgreSQL, ~20 is a
+    # reasonable starting pool size.
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+
+    # Reuse the most recently returned pooled connection first (LIFO).
+    # Keeps the working set of connections small and warm so idle
+    # overflow connections can be closed; set to false for FIFO rotation.
+    db_pool_lifo: bool = True
+
     # Directory where uploaded files are stored.
     # This path should be writable by the application container/process.
     upload_dir: str = "./uploads"
@@ -53,9 +66,12 @@ class Settings(BaseSettings):
     allowed_file_types: list[str] = ["pdf"]
 
     # Maximum allowed file size (in megabytes).
-    # Requests exceeding this limit should be rejected.
+    # Requests exceeding this limit are rejected with 413.
     max_file_size_mb: int = 10
 
+    # Maximum number of files accepted by a single batch upload.
+    max_batch_files: int = 20
+
     # Enable or disable CORS support.
     # Useful for local development and browser-based clients.
     enable_cors: bool = True
@@ -64,11 +80,28 @@ class Settings(BaseSettings):
     # Default is permissive for development; should be restricted in production.
     cors_origins: list[str] = ["*"]
 
+    # Artificial delay (in seconds) applied by the simulated submission
+    # processing step before it completes. Disabled by default; set it to
+    # a few seconds to observe the PROCESSING state in demos.
+    simulated_delay_s: float = 0.0
+
     # Application log level.
     # Typical values: debug, info, warning, error, critical
     log_level: str = "info"
 
+    @property
+    def max_upload_bytes(self) -> int:
+        """Maximum allowed file size, in bytes."""
+        return self.max_file_size_mb * 1024 * 1024
 
-# Instantiate settings at import time so configuration
-# is loaded once and shared across the application.
-settings = Settings()  # type: ignore[call-arg]
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    Settings are built on first use rather than at import time, so importing
+    this module stays cheap, and the result is cached so environment and
+    `.env` parsing happens only once per process.
+    """
+    return Settings()  # type: ignore[call-arg]
@@ -9,26 +9,107 @@ these shared objects to ensure consistent configuration
 and connection handling.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from typing import Any
 
-from .config import settings
+from sqlalchemy import URL, event, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
-# Create the SQLAlchemy engine using the configured database URL.
+from .config import Settings, get_settings
+
+# asyncio driver used for each backend when `DATABASE_URL` names none.
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def _async_url(database_url: str) -> URL:
+    """
+    Return `database_url` with an asyncio driver.
+
+    `DATABASE_URL` keeps its usual driver-less form (`sqlite:///...`,
+    `postgresql://...`); the matching asyncio driver is filled in here.
+    URLs that name a driver explicitly are used as given.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if url.drivername == backend and backend in _ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+    return url
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """
+    Build connection-pool options for the configured database.
+
+    - In-memory SQLite only exists for the lifetime of one connection,
+      so a single shared connection (`StaticPool`) is used.
+    - Everything else gets an explicitly sized queue pool, so connections
+      stay open and warm between requests instead of being re-established.
+      Checkout is LIFO by default (`db_pool_lifo`): the most recently used
+      connection is reused first, so surplus connections sit idle and can
+      age out after bursts.
+    - Network databases additionally ping connections on checkout and
+      recycle them after 30 minutes, so connections dropped by the server
+      or a proxy are replaced transparently. A local SQLite file cannot go
+      stale, so it skips the per-checkout ping.
+    """
+    url = make_url(settings.database_url)
+
+    queue_pool: dict[str, Any] = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_use_lifo": settings.db_pool_lifo,
+    }
+
+    if url.get_backend_name() != "sqlite":
+        return {**queue_pool, "pool_pre_ping": True, "pool_recycle": 1800}
+
+    if url.database in (None, "", ":memory:"):
+        return {"poolclass": StaticPool}
+    return queue_pool
+
+
+# Create the asyncio SQLAlchemy engine using the configured database URL.
 #
-# The `check_same_thread=False` flag is required when using SQLite
-# in multi-threaded environments such as FastAPI, where requests
-# may be handled concurrently.
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False},
+# Queries are awaited on the event loop rather than run in a threadpool,
+# so a request waiting on the database holds no OS thread.
+engine = create_async_engine(
+    _async_url(get_settings().database_url), **_engine_options(get_settings())
 )
 
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragma(dbapi_conn: Any, _: Any) -> None:
+        """
+        Tune each new SQLite connection for concurrent writers.
+
+        - WAL lets readers proceed while a write is in progress.
+        - `synchronous=NORMAL` fsyncs at WAL checkpoints instead of on
+          every commit; still safe against corruption in WAL mode.
+        - Temporary tables and indices are kept in memory.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
 # Session factory used to create new database sessions per request.
 #
 # Sessions should be short-lived and explicitly closed after use
 # (typically via dependency injection in FastAPI routes).
-SessionLocal = sessionmaker(bind=engine)
+#
+# `expire_on_commit=False` keeps attribute values loaded after commit.
+# Routes return the objects they just wrote (often via INSERT ... RETURNING);
+# expiring them would trigger a redundant SELECT during serialization.
+#
+# Expired attributes would also have to be reloaded with an explicit
+# `await`; attribute access cannot do implicit I/O on an `AsyncSession`.
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 # Base class for all ORM models.
 #
@@ -0,0 +1,68 @@
+"""
+Request size limits for the Profile Intake API.
+
+This module provides the ASGI middleware that rejects oversized
+request bodies before they are read.
+"""
+
+from __future__ import annotations
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import get_settings
+
+# Allowance for the multipart envelope (boundaries, part headers, form
+# fields) around an uploaded file, so a file right at the size limit is
+# not rejected because of it.
+_MULTIPART_OVERHEAD = 64 * 1024
+
+# Batch uploads carry up to `max_batch_files` files in one body.
+_BATCH_PATH_SUFFIX = "/submissions/batch"
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject requests under `prefix` whose declared body is too large.
+
+    FastAPI parses multipart bodies (spooling them to disk) before the
+    route handler runs, so a size check in the handler only happens after
+    the whole upload has been received. Checking `Content-Length` here
+    answers 413 before a single body byte is read.
+
+    Batch upload bodies may hold up to `max_batch_files` files, so their
+    limit scales accordingly.
+
+    Requests without a `Content-Length` (chunked uploads) pass through and
+    are checked against the actual file sizes by the upload routes.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str = "/api/") -> None:
+        self.app = app
+        self.prefix = prefix
+        settings = get_settings()
+        self._max_bytes = settings.max_upload_bytes + _MULTIPART_OVERHEAD
+        self._max_batch_bytes = settings.max_batch_files * self._max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._is_too_large(scope):
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse({"detail": "File too large"}, status_code=413)
+        await response(scope, receive, send)
+
+    def _is_too_large(self, scope: Scope) -> bool:
+        """Check the request's `Content-Length` header against the limit."""
+        if scope["path"].endswith(_BATCH_PATH_SUFFIX):
+            max_bytes = self._max_batch_bytes
+        else:
+            max_bytes = self._max_bytes
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                return value.isdigit() and int(value) > max_bytes
+        return False
@@ -10,29 +10,88 @@ This module is responsible for:
 It intentionally contains no business logic.
 """
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
 from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
 
+from .auth import BearerAuthMiddleware
+from .config import get_settings
 from .database import Base, engine
+from .limits import MaxBodySizeMiddleware
 from .routes import router
 
-# Create all database tables on application startup.
-#
-# This is suitable for local development and demo environments.
-# In production systems, schema migrations (e.g. Alembic)
-# would typically be used instead.
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan hook.
+
+    On startup, all database tables and the upload directory are created.
+    This runs once per worker process after it has started, rather than as
+    a side effect of importing this module (which every forked worker, test
+    and tool would pay for) or on every upload request.
+
+    Creating tables this way is suitable for local development and demo
+    environments. In production systems, schema migrations (e.g. Alembic)
+    would typically be used instead.
+
+    On shutdown, pooled database connections are closed explicitly
+    rather than left for the garbage collector.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    os.makedirs(get_settings().upload_dir, exist_ok=True)
+    yield
+    await engine.dispose()
+
 
 # Instantiate the FastAPI application.
 #
 # The title is used in generated OpenAPI documentation
 # and interactive API docs.
-app = FastAPI(title="Profile Intake API")
+app = FastAPI(title="Profile Intake API", lifespan=lifespan)
 
 # Register all API routes under their defined prefixes.
 # Routing logic is kept in separate modules to maintain
 # a clean separation of concerns.
 app.include_router(router)
 
+# Reject oversized request bodies before they are read.
+app.add_middleware(MaxBodySizeMiddleware, prefix="/api/")
+
+# Enforce Bearer auth on every `/api/` route before routing happens.
+# Health checks and the interactive docs stay public.
+# Added last, so it runs first: unauthenticated requests always get 401.
+app.add_middleware(BearerAuthMiddleware, prefix="/api/")
+
+
+def _openapi() -> dict[str, Any]:
+    """
+    Build the OpenAPI schema with Bearer auth documented on `/api/` routes.
+
+    Auth is enforced by middleware, which FastAPI cannot see when it
+    generates the schema, so the security scheme is added here to keep
+    Swagger's "Authorize" button and per-operation lock icons.
+    """
+    if app.openapi_schema is None:
+        schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+        schema.setdefault("components", {})["securitySchemes"] = {
+            "HTTPBearer": {"type": "http", "scheme": "bearer"},
+        }
+        for path, operations in schema["paths"].items():
+            if path.startswith("/api/"):
+                for operation in operations.values():
+                    operation["security"] = [{"HTTPBearer": []}]
+        app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
 
 @app.get("/healthz")
 def health():
@@ -8,7 +8,8 @@ to avoid runtime response validation errors.
 
 from __future__ import annotations
 
-import uuid
+import secrets
+import time
 from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
@@ -17,9 +18,24 @@ from sqlalchemy.orm import relationship
 from .database import Base
 
 
-def _uuid_str() -> str:
-    """Generate a UUID string suitable for primary keys."""
-    return str(uuid.uuid4())
+def new_id() -> str:
+    """
+    Generate a time-ordered 128-bit identifier (32 hex chars) for primary keys.
+
+    The layout is UUIDv7 (RFC 9562): a 48-bit Unix timestamp in milliseconds,
+    then random bits. Ids created close together sort close together, so
+    inserts land at the end of the primary-key B-tree instead of at random
+    pages as fully random ids do. The random part comes from the OS CSPRNG.
+
+    Ids can be generated before the row is written, so callers may use
+    them right away (e.g. to name the stored file). SQLAlchemy passes an
+    execution context to defaults that accept an argument, so this takes
+    none.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 9562 variant
+    return f"{value:032x}"
 
 
 class Profile(Base):
@@ -33,7 +49,7 @@ class Profile(Base):
 
     __tablename__ = "profiles"
 
-    id = Column(String, primary_key=True, default=_uuid_str, nullable=False)
+    id = Column(String, primary_key=True, default=new_id, nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     email = Column(String, nullable=False, unique=True, index=True)
@@ -59,12 +75,15 @@ class Submission(Base):
 
     __tablename__ = "submissions"
 
-    id = Column(String, primary_key=True, default=_uuid_str, nullable=False)
+    id = Column(String, primary_key=True, default=new_id, nullable=False)
 
     profile_id = Column(String, ForeignKey("profiles.id"), nullable=False, index=True)
 
     filename = Column(String, nullable=False)
-    status = Column(String, nullable=False, default="UPLOADED")
+
+    # Indexed so lookups/filters by lifecycle state (e.g. "all PROCESSING
+    # submissions") don't require a full table scan.
+    status = Column(String, nullable=False, default="UPLOADED", index=True)
     locked = Column(Boolean, nullable=False, default=False)
 
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
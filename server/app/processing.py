@@ -1,9 +1,77 @@
 """
 Background processing logic for submissions.
 
-This module is reserved for asynchronous workflows such as
-document parsing, validation, or enrichment.
+This module owns the asynchronous submission workflow, kept apart
+from the HTTP layer. Routes hand work off through `enqueue_submission`,
+which is the single seam to replace if processing ever moves to an
+out-of-process worker queue.
 
 Current processing is intentionally simple and simulated
 via FastAPI background tasks.
 """
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from fastapi import BackgroundTasks
+from sqlalchemy import update
+
+from .config import get_settings
+from .database import SessionLocal
+from .models import Submission
+
+
+def enqueue_submission(
+    bg: BackgroundTasks,
+    submission_id: str,
+    on_complete: Callable[[str], None] | None = None,
+) -> None:
+    """
+    Schedule processing for a submitted document.
+
+    The task runs after the HTTP response has been sent, so `/submit`
+    returns as soon as its own commit is done. `on_complete` is called
+    with the submission id once processing has finished.
+    """
+    bg.add_task(process_submission, submission_id, on_complete)
+
+
+async def process_submission(
+    submission_id: str,
+    on_complete: Callable[[str], None] | None = None,
+) -> None:
+    """
+    Background task to process a submission.
+
+    This simulates asynchronous processing without introducing
+    external infrastructure (e.g. message queues or workers).
+
+    The optional simulated work (`simulated_delay_s`, off by default) is an
+    `asyncio.sleep` and the database update is awaited, so pending
+    submissions wait on the event loop instead of each pinning a
+    threadpool thread.
+    """
+    delay = get_settings().simulated_delay_s
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+    await _mark_completed(submission_id)
+
+    if on_complete is not None:
+        on_complete(submission_id)
+
+
+async def _mark_completed(submission_id: str) -> None:
+    """
+    Move a processed submission to its terminal `COMPLETED` state.
+
+    A single UPDATE inside one short transaction: no SELECT to load the row
+    first, and the connection goes back to the pool as soon as it commits.
+    Unknown ids simply match no rows.
+    """
+    async with SessionLocal.begin() as db:
+        await db.execute(
+            update(Submission).where(Submission.id == submission_id).values(status="COMPLETED")
+        )
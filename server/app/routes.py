@@ -8,11 +8,16 @@ concerns and delegate business logic to other layers where possible.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import io
 import os
 import shutil
-import time
-from collections.abc import Generator
+import sys
+from collections.abc import AsyncIterator
+from typing import BinaryIO, cast
 
+from cachetools import TTLCache
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -22,31 +27,160 @@ from fastapi import (
     UploadFile,
     status,
 )
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .auth import require_auth
-from .config import settings
+from .config import get_settings
 from .database import SessionLocal
-from .models import Profile, Submission
+from .models import Profile, Submission, new_id
+from .processing import enqueue_submission
 from .schemas import ProfileCreate, ProfileOut, SubmissionOut
 
 # Router instance for versioned API endpoints.
 # All routes in this module are prefixed with `/api/v1`.
 router = APIRouter(prefix="/api/v1")
 
-
-def get_db() -> Generator[Session, None, None]:
+# File-to-file `sendfile(2)` is Linux-only; other platforms (e.g. macOS)
+# require the destination to be a socket.
+_FILE_SENDFILE = sys.platform.startswith("linux")
+
+# Below this size the fixed cost of setting up `sendfile` outweighs
+# the saved userspace copy, so small files use a buffered copy.
+_SENDFILE_MIN_BYTES = 64 * 1024
+
+# Chunk and buffer size for the buffered copy. Spooled uploads stay in
+# memory up to 1 MB, so those are copied with a single read and write.
+_COPY_BUFSIZE = 1024 * 1024
+
+# Every PDF document begins with this signature.
+_PDF_MAGIC = b"%PDF-"
+
+# Short-lived cache for `GET /submissions/{id}`.
+#
+# Clients poll this endpoint in tight loops while a submission is processing.
+# Caching the serialized resource for 500 ms caps database reads at ~2/s per
+# submission while keeping results fresh. Entries are dropped explicitly on
+# every status change made by this process.
+#
+# Everything runs on the event loop, so individual cache operations need no
+# lock, but a read awaits the database between checking and filling the
+# cache. A status change landing during that await would otherwise be
+# undone by the read writing back the value it loaded before the change.
+# `_status_generations` counts changes per submission: a read only fills
+# the cache if the count is the same as when it started. Counts are kept
+# far longer than any read takes, and refreshed on every change.
+_status_cache: TTLCache[str, SubmissionOut] = TTLCache(maxsize=10_000, ttl=0.5)
+_status_generations: TTLCache[str, int] = TTLCache(maxsize=100_000, ttl=60)
+
+# Open `GET /submissions/{id}/events` streams, by submission id.
+#
+# Each stream registers an `asyncio.Event` and is woken as soon as this
+# process changes the submission's status. Changes made elsewhere (e.g.
+# another worker process) are picked up by a periodic re-check.
+_status_waiters: dict[str, set[asyncio.Event]] = {}
+
+# How often an event stream re-reads the status without being woken.
+# Also keeps idle connections alive through proxies.
+_EVENTS_RECHECK_S = 15.0
+
+# Statuses after which a submission no longer changes.
+_FINAL_STATUSES = frozenset({"COMPLETED", "REJECTED"})
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Database session dependency.
 
     Creates a new SQLAlchemy session per request and ensures
     it is properly closed once the request is completed.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def _status_changed(submission_id: str) -> None:
+    """
+    Drop any cached status for a submission after it changes, and wake
+    the event streams following it.
+    """
+    _status_generations[submission_id] = _status_generations.get(submission_id, 0) + 1
+    _status_cache.pop(submission_id, None)
+    for event in _status_waiters.get(submission_id, ()):
+        event.set()
+
+
+async def _read_status(submission_id: str, db: AsyncSession | None = None) -> SubmissionOut | None:
+    """
+    Return the current status of a submission, or None if it does not exist.
+
+    Served from the short-lived status cache when possible. Without `db`,
+    a session is opened just for the lookup. The loaded value is only
+    cached if the status did not change while it was being read.
+    """
+    cached = _status_cache.get(submission_id)
+    if cached is not None:
+        return cached
+
+    generation = _status_generations.get(submission_id, 0)
+
+    if db is None:
+        async with SessionLocal() as own_db:
+            submission = await own_db.get(Submission, submission_id)
+    else:
+        submission = await db.get(Submission, submission_id)
+    if submission is None:
+        return None
+
+    result = SubmissionOut.model_validate(submission)
+    if _status_generations.get(submission_id, 0) == generation:
+        _status_cache[submission_id] = result
+    return result
+
+
+async def _status_events(submission_id: str) -> AsyncIterator[str]:
+    """
+    Yield a Server-Sent Event each time a submission's status changes.
+
+    The waiter is registered before every read, so a change that lands
+    between the read and the wait still wakes the stream. The stream ends
+    once the submission reaches a final status.
+    """
+    last = None
+    while True:
+        event = asyncio.Event()
+        _status_waiters.setdefault(submission_id, set()).add(event)
+        try:
+            current = await _read_status(submission_id)
+            if current is None:
+                return
+            if current != last:
+                yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+                last = current
+            if current.status in _FINAL_STATUSES:
+                return
+            try:
+                await asyncio.wait_for(event.wait(), timeout=_EVENTS_RECHECK_S)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+        finally:
+            waiters = _status_waiters.get(submission_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del _status_waiters[submission_id]
+
+
+def _ensure_upload_size(file: UploadFile) -> None:
+    """
+    Validate that the uploaded file is within the configured size limit.
+
+    Oversized requests that declare a `Content-Length` are already turned
+    away by `MaxBodySizeMiddleware`; this catches the ones that do not.
+    """
+    if file.size is not None and file.size > get_settings().max_upload_bytes:
+        raise HTTPException(status_code=413, detail="File too large")
 
 
 def _ensure_pdf_upload(file: UploadFile) -> None:
@@ -56,16 +190,165 @@ def _ensure_pdf_upload(file: UploadFile) -> None:
     We validate both the reported MIME type and the filename extension.
     Neither is perfect alone, but together they significantly reduce
     accidental non-PDF uploads without requiring heavy content inspection.
+
+    Both of those are client-controlled, so the file signature is checked
+    too: every PDF starts with `%PDF-`. Only the first five bytes are read,
+    and the stream is rewound afterwards.
     """
-    if file.content_type != "application/pdf":
+    filename = file.filename or ""
+    if file.content_type != "application/pdf" or not filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    filename = file.filename or ""
-    _, ext = os.path.splitext(filename)
-    if ext.lower() != ".pdf":
+    head = file.file.read(len(_PDF_MAGIC))
+    file.file.seek(0)
+    if head != _PDF_MAGIC:
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
 
+def _disk_fd(src: BinaryIO) -> int | None:
+    """
+    Return the OS file descriptor backing `src`, if its data is on disk.
+
+    An in-memory `SpooledTemporaryFile` reports `_rolled=False`; calling
+    `fileno()` on it would force a rollover (an extra copy to disk), so it
+    is treated as having no descriptor. Other in-memory streams raise on
+    `fileno()`.
+    """
+    if getattr(src, "_rolled", None) is False:
+        return None
+    try:
+        return src.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _sendfile(in_fd: int, file_path: str, size: int) -> None:
+    """
+    Copy `size` bytes from `in_fd` to `file_path` with `sendfile(2)`.
+
+    Explicit offsets are used: the Python-level buffer of the source may
+    have read ahead (e.g. the signature check), so the OS file position of
+    `in_fd` is not guaranteed to match the stream position. The whole file
+    is requested at once; the loop only repeats on short transfers.
+    """
+    offset = 0
+    out_fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    finally:
+        os.close(out_fd)
+
+
+def _store_upload(src: BinaryIO, file_path: str) -> None:
+    """
+    Persist an uploaded file to `file_path`.
+
+    Starlette spools uploads larger than 1 MB to an on-disk temporary file.
+    When the source is on disk and at least `_SENDFILE_MIN_BYTES` long,
+    `os.sendfile` copies the bytes kernel-side (page cache to page cache)
+    instead of bouncing every chunk through userspace buffers. Small or
+    in-memory uploads, and filesystems that reject `sendfile`, fall back
+    to a buffered copy in 1 MB chunks.
+    """
+    in_fd = _disk_fd(src) if _FILE_SENDFILE else None
+    if in_fd is not None:
+        size = os.fstat(in_fd).st_size
+        if size >= _SENDFILE_MIN_BYTES:
+            try:
+                _sendfile(in_fd, file_path, size)
+                return
+            except OSError:
+                pass  # e.g. EINVAL/ENOSYS on some filesystems; copy instead
+
+    src.seek(0)
+    with open(file_path, "wb", buffering=_COPY_BUFSIZE) as out_file:
+        shutil.copyfileobj(src, out_file, _COPY_BUFSIZE)
+
+
+async def _insert_submissions(
+    db: AsyncSession, profile_id: str, ids: list[str], filenames: list[str]
+) -> list[Submission]:
+    """
+    Insert one new `UPLOADED` submission per (id, filename), uncommitted.
+
+    A single multi-row INSERT ... RETURNING; rows are returned in the
+    order of `ids`. The caller owns the transaction.
+    """
+    stmt = insert(Submission).returning(Submission, sort_by_parameter_order=True)
+    rows = [
+        {
+            "id": submission_id,
+            "profile_id": profile_id,
+            "filename": filename,
+            "status": "UPLOADED",
+            "locked": False,
+        }
+        for submission_id, filename in zip(ids, filenames, strict=True)
+    ]
+    return list(await db.scalars(stmt, rows))
+
+
+def _remove_files(paths: list[str]) -> None:
+    """Delete stored uploads, ignoring ones that were never written."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+async def _save_uploads(
+    db: AsyncSession, profile_id: str, files: list[UploadFile]
+) -> list[Submission]:
+    """
+    Create one submission per uploaded file and store the files on disk.
+
+    The profile is looked up first, so uploads for an unknown profile are
+    rejected before anything is written to disk.
+
+    Submission ids are then generated up front, which fixes the stored
+    file names before anything is written. The INSERT (on the event loop)
+    and the file writes (in the threadpool) are therefore independent and
+    run concurrently; the transaction is only committed once every write
+    has succeeded. If anything fails, the transaction is rolled back, the
+    stored files are removed again and the first error is raised.
+
+    Raises:
+        HTTPException: 404 if the profile does not exist.
+    """
+    if await db.get(Profile, profile_id) is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    ids = [new_id() for _ in files]
+
+    # The upload directory is created once at startup (see `main.lifespan`).
+    upload_dir = get_settings().upload_dir
+    paths = [os.path.join(upload_dir, f"{submission_id}.pdf") for submission_id in ids]
+
+    outcomes = await asyncio.gather(
+        _insert_submissions(db, profile_id, ids, [file.filename or "" for file in files]),
+        *(
+            run_in_threadpool(_store_upload, file.file, path)
+            for file, path in zip(files, paths, strict=True)
+        ),
+        return_exceptions=True,
+    )
+
+    try:
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            raise errors[0]
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        _remove_files(paths)
+        raise
+
+    return cast(list[Submission], outcomes[0])
+
+
 @router.post(
     "/profiles",
     response_model=ProfileOut,
@@ -77,11 +360,10 @@ def _ensure_pdf_upload(file: UploadFile) -> None:
         "Authentication is enforced via Bearer token."
     ),
 )
-def create_profile(
+async def create_profile(
     payload: ProfileCreate,
-    db: Session = Depends(get_db),
-    _: None = Depends(require_auth),
-) -> Profile:
+    db: AsyncSession = Depends(get_db),
+) -> ProfileOut:
     """
     Create a new profile.
 
@@ -89,14 +371,18 @@ def create_profile(
     - Swagger/OpenAPI shows the real schema (required fields, types)
     - Invalid requests return 422 (validation error) instead of 500
     """
-    # Convert Pydantic model -> plain dict for SQLAlchemy
-    profile = Profile(**payload.model_dump())
+    # Convert Pydantic model -> plain dict for SQLAlchemy.
+    #
+    # INSERT ... RETURNING hands back the persisted row (including the
+    # generated id/created_at) in the same round trip, so no follow-up
+    # SELECT is needed to populate the response.
+    stmt = insert(Profile).values(**payload.model_dump()).returning(Profile)
+    profile = (await db.execute(stmt)).scalar_one()
+    await db.commit()
 
-    db.add(profile)
-    db.commit()
-    db.refresh(profile)
-
-    return profile
+    # Build the response schema here, while the row is in hand; FastAPI
+    # then only has to confirm it is already a `ProfileOut`.
+    return ProfileOut.model_validate(profile)
 
 
 @router.post(
@@ -106,41 +392,69 @@ def create_profile(
     summary="Upload Submission",
     description="Upload a PDF document associated with a profile (multipart/form-data).",
 )
-def upload_submission(
+async def upload_submission(
     profile_id: str,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),  # noqa: B008
-    _: None = Depends(require_auth),  # noqa: B008
-) -> Submission:
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> SubmissionOut:
     """
     Upload a PDF document associated with a profile.
 
-    Only PDF files are accepted. A new Submission entity is created
+    Only PDF files up to `max_file_size_mb` are accepted. A new Submission entity is created
     with an initial status of `UPLOADED`.
-    """
-    profile = db.get(Profile, profile_id)
-    if profile is None:
-        raise HTTPException(status_code=404, detail="Profile not found")
 
+    Database round trips are awaited on the event loop and the PDF is
+    flushed to disk in the threadpool, so the event loop keeps serving
+    other requests meanwhile, without a worker thread being pinned for
+    the whole request.
+    """
+    # Validate first: it only inspects headers, the file size and the first
+    # five bytes, so invalid uploads are rejected before any database or
+    # disk I/O.
+    _ensure_upload_size(file)
     _ensure_pdf_upload(file)
 
-    submission = Submission(
-        profile_id=profile_id,
-        filename=file.filename,
-        status="UPLOADED",
-        locked=False,
-    )
-    db.add(submission)
-    db.commit()
-    db.refresh(submission)
+    [submission] = await _save_uploads(db, profile_id, [file])
 
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    file_path = os.path.join(settings.upload_dir, f"{submission.id}.pdf")
+    return SubmissionOut.model_validate(submission)
 
-    with open(file_path, "wb") as out_file:
-        shutil.copyfileobj(file.file, out_file)
 
-    return submission
+@router.post(
+    "/submissions/batch",
+    response_model=list[SubmissionOut],
+    status_code=status.HTTP_200_OK,
+    summary="Upload Submissions (Batch)",
+    description=(
+        "Upload several PDF documents associated with a profile in one request "
+        "(multipart/form-data, repeated `files` field)."
+    ),
+)
+async def upload_submissions_batch(
+    profile_id: str,
+    files: list[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> list[SubmissionOut]:
+    """
+    Upload several PDF documents associated with a profile.
+
+    The batch is all-or-nothing: every file is validated before any
+    database or disk I/O, and a single invalid file rejects the whole
+    request. One Submission per file is then created, in `UPLOADED`
+    state, with one INSERT and one commit, while the files are written to
+    disk concurrently in the threadpool.
+
+    Submissions are returned in the order the files were sent.
+    """
+    if len(files) > get_settings().max_batch_files:
+        raise HTTPException(status_code=400, detail="Too many files in batch")
+
+    for file in files:
+        _ensure_upload_size(file)
+        _ensure_pdf_upload(file)
+
+    submissions = await _save_uploads(db, profile_id, files)
+
+    return [SubmissionOut.model_validate(submission) for submission in submissions]
 
 
 @router.post(
@@ -150,34 +464,42 @@ def upload_submission(
     summary="Submit Submission",
     description="Submit an uploaded document for asynchronous processing.",
 )
-def submit(
+async def submit(
     submission_id: str,
     bg: BackgroundTasks,
-    db: Session = Depends(get_db),  # noqa: B008
-    _: None = Depends(require_auth),  # noqa: B008
-) -> Submission:
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> SubmissionOut:
     """
     Submit an uploaded document for processing.
 
     Once submitted, the submission is locked and enters
     asynchronous processing. Re-submission is not allowed.
+
+    The lock is taken with a single conditional `UPDATE ... RETURNING`:
+    it only matches an unlocked row and hands back the updated row in the
+    same round trip. This also makes concurrent submits of the same id
+    safe, since only one of them can match. The extra lookup only happens
+    on the error path, to tell "not found" from "already submitted".
     """
-    submission = db.get(Submission, submission_id)
-    if submission is None:
-        raise HTTPException(status_code=404, detail="Submission not found")
+    stmt = (
+        update(Submission)
+        .where(Submission.id == submission_id, Submission.locked.is_(False))
+        .values(locked=True, status="PROCESSING")
+        .returning(Submission)
+    )
+    submission = (await db.execute(stmt)).scalar_one_or_none()
 
-    if submission.locked:
+    if submission is None:
+        if await db.get(Submission, submission_id) is None:
+            raise HTTPException(status_code=404, detail="Submission not found")
         raise HTTPException(status_code=409, detail="Submission has already been submitted")
 
-    submission.locked = True  # type: ignore[assignment]
-    submission.status = "PROCESSING"  # type: ignore[assignment]
-
-    db.commit()
-    db.refresh(submission)
+    await db.commit()
+    _status_changed(submission_id)
 
-    bg.add_task(process_submission, submission_id)
+    enqueue_submission(bg, submission_id, on_complete=_status_changed)
 
-    return submission
+    return SubmissionOut.model_validate(submission)
 
 
 @router.get(
@@ -187,39 +509,47 @@ def submit(
     summary="Get Submission Status",
     description="Retrieve the current status of a submission.",
 )
-def get_submission_status(
+async def get_submission_status(
     submission_id: str,
-    db: Session = Depends(get_db),  # noqa: B008
-    _: None = Depends(require_auth),  # noqa: B008
-) -> Submission:
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> SubmissionOut:
     """
     Retrieve the current status of a submission.
 
     Returns the full submission resource, including its
-    lifecycle status and metadata.
+    lifecycle status and metadata. Results may be served from
+    a short-lived (500 ms) in-process cache.
     """
-    submission = db.get(Submission, submission_id)
-    if submission is None:
+    result = await _read_status(submission_id, db)
+    if result is None:
         raise HTTPException(status_code=404, detail="Submission not found")
-    return submission
+    return result
 
 
-def process_submission(submission_id: str) -> None:
+@router.get(
+    "/submissions/{submission_id}/events",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream Submission Status",
+    description=(
+        "Stream the status of a submission as Server-Sent Events (`text/event-stream`).\n\n"
+        "A `status` event carrying the submission resource is sent immediately and on "
+        "every status change; the stream ends once the submission reaches a final status."
+    ),
+)
+async def stream_submission_status(submission_id: str) -> StreamingResponse:
     """
-    Background task to process a submission.
+    Stream the status of a submission as Server-Sent Events.
 
-    This simulates asynchronous processing without introducing
-    external infrastructure (e.g. message queues or workers).
+    Replaces tight polling of `GET /submissions/{id}`: a client keeps one
+    connection open and the database is only read when this process
+    changes the status, plus a periodic re-check as a fallback.
     """
-    time.sleep(2)
-
-    db = SessionLocal()
-    try:
-        submission = db.get(Submission, submission_id)
-        if submission is None:
-            return
+    if await _read_status(submission_id) is None:
+        raise HTTPException(status_code=404, detail="Submission not found")
 
-        submission.status = "COMPLETED"  # type: ignore[assignment]
-        db.commit()
-    finally:
-        db.close()
+    return StreamingResponse(
+        _status_events(submission_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -32,7 +32,7 @@ class ProfileOut(ProfileCreate):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(description="Profile UUID")
+    id: str = Field(description="Profile ID (32 hex characters)")
     created_at: datetime = Field(description="Server timestamp when the profile was created")
 
 
@@ -46,8 +46,8 @@ class SubmissionOut(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(description="Submission UUID")
-    profile_id: str = Field(description="Owning Profile UUID")
+    id: str = Field(description="Submission ID (32 hex characters)")
+    profile_id: str = Field(description="Owning Profile ID")
     filename: str = Field(description="Original uploaded filename")
     status: str = Field(description="Submission lifecycle status")
     locked: bool = Field(description="True after /submit is called (prevents re-submission)")
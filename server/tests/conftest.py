@@ -4,51 +4,87 @@ Pytest fixtures for the Profile Intake API.
 
 from __future__ import annotations
 
-import importlib
-from pathlib import Path
+import shutil
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
 
 
-@pytest.fixture()
-def test_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+@pytest.fixture(scope="session")
+def session_env(tmp_path_factory: pytest.TempPathFactory):
     """
-    Function scope => every test gets its own temp dir + its own SQLite DB.
+    Session scope => one temp dir, one SQLite DB and one app for the whole run.
+
+    Settings are read once and the engine is created at import time, so the
+    environment has to be in place before `app` is first imported.
     """
-    db_path = tmp_path / "test.db"
+    root = tmp_path_factory.mktemp("app")
+    db_path = root / "test.db"
+
+    # Not created here: the app creates it at startup.
+    upload_dir = root / "uploads"
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("API_TOKEN", "test-token")
+        mp.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+        mp.setenv("UPLOAD_DIR", str(upload_dir))
+        mp.setenv("SIMULATED_DELAY_S", "0")
+
+        from app.config import get_settings
 
-    upload_dir = tmp_path / "uploads"
-    upload_dir.mkdir(parents=True, exist_ok=True)
+        get_settings.cache_clear()
 
-    monkeypatch.setenv("API_TOKEN", "test-token")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-    monkeypatch.setenv("UPLOAD_DIR", str(upload_dir))
+        yield {"db_path": db_path, "upload_dir": upload_dir}
+
+
+@pytest.fixture(scope="session")
+def app_client(session_env):
+    """
+    Import the app once and keep its lifespan running for the session.
+    """
+    from app.main import app as fastapi_app
 
-    return {"db_path": db_path, "upload_dir": upload_dir}
+    # Entering the client runs the app lifespan (table creation on startup).
+    with TestClient(fastapi_app) as test_client:
+        yield test_client
 
 
 @pytest.fixture()
-def client(test_env):
+def test_env(session_env):
+    return session_env
+
+
+@pytest.fixture(scope="session")
+def reset_engine(session_env):
+    """
+    Plain synchronous engine on the test database, for resetting it between
+    tests without going through the app's event loop.
+    """
+    engine = create_engine(f"sqlite:///{session_env['db_path']}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(app_client, test_env, reset_engine):
     """
-    Reload config/database/routes/main so routes re-import the fresh get_db + SessionLocal.
+    Reset shared state so every test starts from an empty DB and upload dir.
     """
-    import app.config as app_config
-    import app.database as app_database
-    import app.main as app_main
-    import app.models as app_models
-    import app.routes as app_routes
+    from app.database import Base
+    from app.routes import _status_cache, _status_generations
+
+    Base.metadata.drop_all(bind=reset_engine)
+    Base.metadata.create_all(bind=reset_engine)
 
-    # Order matters: config -> database -> models -> routes -> main
-    importlib.reload(app_config)
-    importlib.reload(app_database)
-    importlib.reload(app_models)
-    importlib.reload(app_routes)
-    importlib.reload(app_main)
+    _status_cache.clear()
+    _status_generations.clear()
 
-    from app.main import app as fastapi_app  # noqa: E402
+    upload_dir = test_env["upload_dir"]
+    shutil.rmtree(upload_dir, ignore_errors=True)
+    upload_dir.mkdir()
 
-    return TestClient(fastapi_app)
+    return app_client
 
 
 @pytest.fixture()
@@ -32,3 +32,34 @@ def test_requires_auth_invalid_token(client):
     )
 
     assert resp.status_code == 401
+
+
+def test_accepts_case_insensitive_bearer_scheme(client):
+    """
+    The auth scheme name is case-insensitive (RFC 7235), so a valid token
+    sent as `bearer <token>` should be accepted.
+    """
+    resp = client.post(
+        "/api/v1/profiles",
+        json={
+            "first_name": "A",
+            "last_name": "B",
+            "email": "a@b.com",
+            "github_url": "https://x.com",
+        },
+        headers={"Authorization": "bearer test-token"},
+    )
+
+    assert resp.status_code == 201
+
+
+def test_openapi_documents_bearer_auth(client):
+    """
+    Auth is enforced by middleware, but the OpenAPI schema should still
+    advertise the Bearer scheme on API routes (and not on /healthz).
+    """
+    schema = client.get("/openapi.json").json()
+
+    assert schema["components"]["securitySchemes"]["HTTPBearer"]["scheme"] == "bearer"
+    assert schema["paths"]["/api/v1/profiles"]["post"]["security"] == [{"HTTPBearer": []}]
+    assert "security" not in schema["paths"]["/healthz"]["get"]
@@ -40,3 +40,84 @@ def test_reject_non_pdf(client, auth_headers):
     # - 400 Bad Request (explicit validation failure), or
     # - 422 Unprocessable Entity (request validation error)
     assert r2.status_code in (400, 422)
+
+
+def test_reject_pdf_with_wrong_signature(client, auth_headers, test_env):
+    """
+    A file that claims to be a PDF (name and MIME type) but does not start
+    with the `%PDF-` signature should be rejected before anything is stored.
+    """
+    r1 = client.post(
+        "/api/v1/profiles",
+        json={
+            "first_name": "John",
+            "last_name": "Smith",
+            "email": "john.smith@test.com",
+        },
+        headers=auth_headers,
+    )
+    assert r1.status_code in (200, 201)
+
+    # PNG bytes disguised as a PDF.
+    files = {
+        "file": ("resume.pdf", b"\x89PNG\r\n\x1a\nfake", "application/pdf"),
+    }
+
+    r2 = client.post(
+        "/api/v1/submissions",
+        params={"profile_id": r1.json()["id"]},
+        files=files,
+        headers=auth_headers,
+    )
+
+    assert r2.status_code == 400
+
+    # Nothing should have been written to the upload directory.
+    assert list(test_env["upload_dir"].iterdir()) == []
+
+
+def test_reject_non_pdf_before_profile_lookup(client, auth_headers):
+    """
+    File validation runs before any database work, so a non-PDF upload is
+    rejected with 400 even when the target profile does not exist.
+    """
+    files = {
+        "file": ("img.png", b"\x89PNG\r\n\x1a\nfake", "image/png"),
+    }
+
+    resp = client.post(
+        "/api/v1/submissions",
+        params={"profile_id": "does-not-exist"},
+        files=files,
+        headers=auth_headers,
+    )
+
+    assert resp.status_code == 400
+
+
+def test_reject_oversized_upload(client, auth_headers, test_env):
+    """
+    Uploads above MAX_FILE_SIZE_MB (10 MB by default) should be rejected
+    with 413 Payload Too Large, without anything being stored.
+    """
+    r1 = client.post(
+        "/api/v1/profiles",
+        json={
+            "first_name": "John",
+            "last_name": "Smith",
+            "email": "john.smith@test.com",
+        },
+        headers=auth_headers,
+    )
+    assert r1.status_code in (200, 201)
+
+    pdf_bytes = b"%PDF-1.4\n" + b"\0" * (11 * 1024 * 1024)
+    r2 = client.post(
+        "/api/v1/submissions",
+        params={"profile_id": r1.json()["id"]},
+        files={"file": ("huge.pdf", pdf_bytes, "application/pdf")},
+        headers=auth_headers,
+    )
+
+    assert r2.status_code == 413
+    assert list(test_env["upload_dir"].iterdir()) == []